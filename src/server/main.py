@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
+import logging
 import os
 from pathlib import Path
 
 from dotenv import load_dotenv
-from fastapi import FastAPI
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi import FastAPI, Request, status
+from fastapi.responses import FileResponse, HTMLResponse, PlainTextResponse, Response
 from fastapi.staticfiles import StaticFiles
 from slowapi.errors import RateLimitExceeded
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 
+from server.models import IngestErrorResponse
 from server.routers import dynamic, index, ingest
 from server.server_utils import lifespan, limiter, rate_limit_exception_handler
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -26,6 +30,39 @@ app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, rate_limit_exception_handler)
 
 
+@app.exception_handler(Exception)
+async def internal_error_exception_handler(request: Request, exc: Exception) -> Response:
+    """Handle unexpected errors with a generic 500 response.
+
+    The exception is logged but never formatted into the response body. API routes get an
+    ``IngestErrorResponse`` so clients can still discriminate it; every other route gets a plain-text body.
+
+    Parameters
+    ----------
+    request : Request
+        The incoming HTTP request.
+    exc : Exception
+        The unhandled exception.
+
+    Returns
+    -------
+    Response
+        A response with status code 500.
+
+    """
+    logger.exception("Unhandled error on %s %s", request.method, request.url.path, exc_info=exc)
+
+    if request.url.path.startswith("/api/"):
+        error_response = IngestErrorResponse.model_construct(error="Internal server error", repo_url="")
+        return Response(
+            content=error_response.model_dump_json(),
+            media_type="application/json",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    return PlainTextResponse("Internal Server Error", status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
 # Mount static files dynamically to serve CSS, JS, and other static assets
 static_dir = Path(__file__).parent.parent / "static"
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
@@ -2,60 +2,11 @@
 
 from __future__ import annotations
 
-from enum import Enum
-from typing import Union
+from typing import Literal, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 
-# needed for type checking (pydantic)
-from server.form_types import IntForm, OptStrForm, StrForm  # noqa: TC001 (typing-only-first-party-import)
-
-
-class PatternType(str, Enum):
-    """Enumeration for pattern types used in file filtering."""
-
-    INCLUDE = "include"
-    EXCLUDE = "exclude"
-
-
-class IngestRequest(BaseModel):
-    """Request model for the /api/ingest endpoint.
-
-    Attributes
-    ----------
-    input_text : str
-        The Git repository URL or slug to ingest.
-    max_file_size : int
-        Maximum file size slider position (0-500) for filtering files.
-    pattern_type : PatternType
-        Type of pattern to use for file filtering (include or exclude).
-    pattern : str
-        Glob/regex pattern string for file filtering.
-    token : str | None
-        GitHub personal access token (PAT) for accessing private repositories.
-
-    """
-
-    input_text: str = Field(..., description="Git repository URL or slug to ingest")
-    max_file_size: int = Field(..., ge=0, le=500, description="File size slider position (0-500)")
-    pattern_type: PatternType = Field(default=PatternType.EXCLUDE, description="Pattern type for file filtering")
-    pattern: str = Field(default="", description="Glob/regex pattern for file filtering")
-    token: str | None = Field(default=None, description="GitHub PAT for private repositories")
-
-    @field_validator("input_text")
-    @classmethod
-    def validate_input_text(cls, v: str) -> str:
-        """Validate that input_text is not empty."""
-        if not v.strip():
-            err = "input_text cannot be empty"
-            raise ValueError(err)
-        return v.strip()
-
-    @field_validator("pattern")
-    @classmethod
-    def validate_pattern(cls, v: str) -> str:
-        """Validate pattern field."""
-        return v.strip()
+from gitingest.utils.compat_typing import Annotated
 
 
 class IngestSuccessResponse(BaseModel):
@@ -63,6 +14,8 @@ class IngestSuccessResponse(BaseModel):
 
     Attributes
     ----------
+    result : Literal[True]
+        Discriminator marking the response as successful.
     repo_url : str
         The original repository URL that was processed.
     short_repo_url : str
@@ -82,6 +35,7 @@ class IngestSuccessResponse(BaseModel):
 
     """
 
+    result: Literal[True] = Field(default=True, description="Always true for successful ingestions")
     repo_url: str = Field(..., description="Original repository URL")
     short_repo_url: str = Field(..., description="Short repository URL (user/repo)")
     summary: str = Field(..., description="Ingestion summary with token estimates")
@@ -97,6 +51,8 @@ class IngestErrorResponse(BaseModel):
 
     Attributes
     ----------
+    result : Literal[False]
+        Discriminator marking the response as an error.
     error : str
         Error message describing what went wrong.
     repo_url : str
@@ -104,12 +60,13 @@ class IngestErrorResponse(BaseModel):
 
     """
 
+    result: Literal[False] = Field(default=False, description="Always false for failed ingestions")
     error: str = Field(..., description="Error message")
     repo_url: str = Field(..., description="Repository URL that failed")
 
 
-# Union type for API responses
-IngestResponse = Union[IngestSuccessResponse, IngestErrorResponse]
+# Union type for API responses, discriminated on the ``result`` flag
+IngestResponse = Annotated[Union[IngestSuccessResponse, IngestErrorResponse], Field(discriminator="result")]
 
 
 class QueryForm(BaseModel):
@@ -135,41 +92,3 @@ class QueryForm(BaseModel):
     pattern_type: str
     pattern: str
     token: str | None = None
-
-    @classmethod
-    def as_form(
-        cls,
-        input_text: StrForm,
-        max_file_size: IntForm,
-        pattern_type: StrForm,
-        pattern: StrForm,
-        token: OptStrForm,
-    ) -> QueryForm:
-        """Create a QueryForm from FastAPI form parameters.
-
-        Parameters
-        ----------
-        input_text : StrForm
-            The input text provided by the user.
-        max_file_size : IntForm
-            The maximum allowed file size for the input.
-        pattern_type : StrForm
-            The type of pattern used for the query (``include`` or ``exclude``).
-        pattern : StrForm
-            Glob/regex pattern string.
-        token : OptStrForm
-            GitHub personal access token (PAT) for accessing private repositories.
-
-        Returns
-        -------
-        QueryForm
-            The QueryForm instance.
-
-        """
-        return cls(
-            input_text=input_text,
-            max_file_size=max_file_size,
-            pattern_type=pattern_type,
-            pattern=pattern,
-            token=token,
-        )
@@ -99,7 +99,7 @@ async def process_query(
             print(f"{Colors.BROWN}WARN{Colors.END}: {Colors.RED}<-  {Colors.END}", end="")
             print(f"{Colors.RED}{exc}{Colors.END}")
 
-        return IngestErrorResponse(error=str(exc), repo_url=short_repo_url)
+        return IngestErrorResponse.model_construct(error=str(exc), repo_url=short_repo_url)
 
     if len(content) > MAX_DISPLAY_SIZE:
         content = (
@@ -118,7 +118,8 @@ async def process_query(
         summary=summary,
     )
 
-    return IngestSuccessResponse(
+    # Every field is produced locally above, so skip re-validating the (potentially large) content strings
+    return IngestSuccessResponse.model_construct(
         repo_url=input_text,
         short_repo_url=short_repo_url,
         summary=summary,
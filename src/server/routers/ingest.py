@@ -1,16 +1,99 @@
 """Ingest endpoint for the API."""
 
-from fastapi import APIRouter, Request, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, Request, Response, status
+from pydantic import BaseModel
 
 from server.form_types import IntForm, OptStrForm, StrForm
-from server.models import IngestErrorResponse, IngestRequest, IngestSuccessResponse, PatternType
+from server.models import IngestErrorResponse, IngestSuccessResponse
 from server.query_processor import process_query
+from server.server_config import MAX_SLIDER_POSITION
 from server.server_utils import limiter
 
 router = APIRouter()
 
 
+def _json(status_code: int, model: BaseModel) -> Response:
+    """Serialize a (small) error response model straight to JSON bytes.
+
+    ``model_dump_json`` serializes in pydantic-core, which avoids building an intermediate ``dict``
+    and re-encoding it with the standard library ``json`` module. Success responses are encoded
+    with ``orjson`` by the handler instead.
+
+    Parameters
+    ----------
+    status_code : int
+        HTTP status code of the response.
+    model : BaseModel
+        The response model to serialize.
+
+    Returns
+    -------
+    Response
+        A response with media type ``application/json`` containing the serialized model.
+
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json", status_code=status_code)
+
+
+def _error(status_code: int, *, error: str, repo_url: str) -> Response:
+    """Build a JSON error response from trusted, locally assembled values.
+
+    The fields are built by the handler itself, so ``model_construct`` is used to skip validation.
+
+    Parameters
+    ----------
+    status_code : int
+        HTTP status code of the response.
+    error : str
+        Error message describing what went wrong.
+    repo_url : str
+        The repository URL that failed to process.
+
+    Returns
+    -------
+    Response
+        A response with media type ``application/json`` containing the serialized ``IngestErrorResponse``.
+
+    """
+    return _json(status_code, IngestErrorResponse.model_construct(error=error, repo_url=repo_url))
+
+
+def _validate_form(input_text: str, max_file_size: int) -> str:
+    """Check the value constraints of the ``/api/ingest`` form fields.
+
+    FastAPI has already type-checked the form fields, so only the value constraints remain.
+
+    Parameters
+    ----------
+    input_text : str
+        Git repository URL or slug to ingest.
+    max_file_size : int
+        Maximum file size slider position.
+
+    Returns
+    -------
+    str
+        The ``input_text`` with surrounding whitespace stripped.
+
+    Raises
+    ------
+    ValueError
+        If ``input_text`` is blank or ``max_file_size`` is outside ``0..MAX_SLIDER_POSITION``.
+
+    """
+    input_text = input_text.strip()
+    if not input_text:
+        msg = "input_text cannot be empty"
+        raise ValueError(msg)
+
+    if not 0 <= max_file_size <= MAX_SLIDER_POSITION:
+        msg = f"max_file_size must be between 0 and {MAX_SLIDER_POSITION}"
+        raise ValueError(msg)
+
+    return input_text
+
+
 @router.post(
     "/api/ingest",
     responses={
@@ -27,7 +110,7 @@ async def api_ingest(
     pattern_type: StrForm = "exclude",
     pattern: StrForm = "",
     token: OptStrForm = None,
-) -> JSONResponse:
+) -> Response:
     """Ingest a Git repository and return processed content.
 
     This endpoint processes a Git repository by cloning it, analyzing its structure,
@@ -51,59 +134,35 @@ async def api_ingest(
 
     Returns
     -------
-    JSONResponse
+    Response
         Success response with ingestion results or error response with appropriate HTTP status code
 
     """
     try:
-        # Validate input using Pydantic model
-        ingest_request = IngestRequest(
-            input_text=input_text,
-            max_file_size=max_file_size,
-            pattern_type=PatternType(pattern_type),
-            pattern=pattern,
-            token=token,
-        )
+        # ``process_query`` rejects unknown pattern types with a ``ValueError``
+        input_text = _validate_form(input_text, max_file_size)
 
         result = await process_query(
-            input_text=ingest_request.input_text,
-            slider_position=ingest_request.max_file_size,
-            pattern_type=ingest_request.pattern_type,
-            pattern=ingest_request.pattern,
-            token=ingest_request.token,
+            input_text=input_text,
+            slider_position=max_file_size,
+            pattern_type=pattern_type,
+            pattern=pattern.strip(),
+            token=token,
         )
 
         if isinstance(result, IngestErrorResponse):
             # Return structured error response with 400 status code
-            return JSONResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                content=result.model_dump(),
-            )
+            return _json(status.HTTP_400_BAD_REQUEST, result)
 
-        # Return structured success response with 200 status code
-        return JSONResponse(
+        # Return structured success response with 200 status code. ``dict(result)`` is a shallow copy of the
+        # model's field values (no ``model_dump`` traversal), and orjson encodes the ``tree`` and ``content``
+        # strings that dominate the payload in a single pass
+        return Response(
+            content=orjson.dumps(dict(result)),
+            media_type="application/json",
             status_code=status.HTTP_200_OK,
-            content=result.model_dump(),
         )
 
     except ValueError as ve:
         # Handle validation errors with 400 status code
-        error_response = IngestErrorResponse(
-            error=f"Validation error: {ve!s}",
-            repo_url=input_text,
-        )
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content=error_response.model_dump(),
-        )
-
-    except Exception as exc:
-        # Handle unexpected errors with 500 status code
-        error_response = IngestErrorResponse(
-            error=f"Internal server error: {exc!s}",
-            repo_url=input_text,
-        )
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content=error_response.model_dump(),
-        )
+        return _error(status.HTTP_400_BAD_REQUEST, error=f"Validation error: {ve!s}", repo_url=input_text)
@@ -0,0 +1,138 @@
+"""Tests for the ``/api/ingest`` endpoint with ``process_query`` mocked out."""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Generator
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from server.main import app
+from server.models import IngestErrorResponse, IngestResponse, IngestSuccessResponse
+from server.server_utils import limiter
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+# ``server.routers`` re-exports the router objects under the submodule names, so resolve the module explicitly
+ingest_module = importlib.import_module("server.routers.ingest")
+
+FORM_DATA = {
+    "input_text": " https://github.com/user/repo ",
+    "max_file_size": "243",
+    "pattern_type": "exclude",
+    "pattern": " *.md ",
+    "token": "",
+}
+
+
+@pytest.fixture(scope="module")
+def test_client() -> Generator[TestClient, None, None]:
+    """Create a test client fixture."""
+    with TestClient(app) as client_instance:
+        client_instance.headers.update({"Host": "localhost"})
+        yield client_instance
+
+
+@pytest.fixture(autouse=True)
+def disable_rate_limit(mocker: MockerFixture) -> None:
+    """Disable the rate limiter so the tests do not count against ``10/minute``."""
+    mocker.patch.object(limiter, "enabled", new=False)
+
+
+@pytest.mark.asyncio
+async def test_api_ingest_success(request: pytest.FixtureRequest, mocker: MockerFixture) -> None:
+    """Test that a successful ingestion returns the serialized success response."""
+    process_query = mocker.patch.object(
+        ingest_module,
+        "process_query",
+        new=AsyncMock(
+            return_value=IngestSuccessResponse.model_construct(
+                repo_url="https://github.com/user/repo",
+                short_repo_url="user/repo",
+                summary="Estimated tokens: 1",
+                tree="repo/\n└── README.md",
+                content='"quoted" content',
+                default_max_file_size=243,
+                pattern_type="exclude",
+                pattern="*.md",
+            ),
+        ),
+    )
+
+    client = request.getfixturevalue("test_client")
+    response = client.post("/api/ingest", data=FORM_DATA)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/json"
+    assert b'"result":true' in response.content
+    assert b'"content":"\\"quoted\\" content"' in response.content
+    process_query.assert_awaited_once_with(
+        input_text="https://github.com/user/repo",
+        slider_position=243,
+        pattern_type="exclude",
+        pattern="*.md",
+        token=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_api_ingest_processing_error(request: pytest.FixtureRequest, mocker: MockerFixture) -> None:
+    """Test that an error returned by ``process_query`` is reported with status code 400."""
+    mocker.patch.object(
+        ingest_module,
+        "process_query",
+        new=AsyncMock(
+            return_value=IngestErrorResponse.model_construct(error="Repository not found", repo_url="user/repo"),
+        ),
+    )
+
+    client = request.getfixturevalue("test_client")
+    response = client.post("/api/ingest", data=FORM_DATA)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.content == b'{"result":false,"error":"Repository not found","repo_url":"user/repo"}'
+
+
+@pytest.mark.asyncio
+async def test_api_ingest_internal_error(mocker: MockerFixture) -> None:
+    """Test that an unexpected error is reported as a generic, discriminated 500 error response."""
+    mocker.patch.object(ingest_module, "process_query", new=AsyncMock(side_effect=RuntimeError("secret details")))
+
+    # Starlette re-raises the exception after the handler runs, so let the client return the response instead
+    with TestClient(app, raise_server_exceptions=False) as client:
+        client.headers.update({"Host": "localhost"})
+        response = client.post("/api/ingest", data=FORM_DATA)
+
+    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert b"secret details" not in response.content
+    error_response = TypeAdapter(IngestResponse).validate_json(response.content)
+    assert isinstance(error_response, IngestErrorResponse)
+    assert error_response.error == "Internal server error"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("overrides", "expected_error"),
+    [
+        ({"input_text": "   "}, b"input_text cannot be empty"),
+        ({"max_file_size": "501"}, b"max_file_size must be between 0 and 500"),
+        ({"pattern_type": "invalid"}, b"Invalid pattern type: invalid"),
+    ],
+)
+async def test_api_ingest_validation_error(
+    request: pytest.FixtureRequest,
+    overrides: dict[str, str],
+    expected_error: bytes,
+) -> None:
+    """Test that invalid form values are rejected with status code 400 before any cloning happens."""
+    client = request.getfixturevalue("test_client")
+    response = client.post("/api/ingest", data={**FORM_DATA, **overrides})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert b'"result":false' in response.content
+    assert expected_error in response.content